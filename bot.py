@@ -1,17 +1,148 @@
 import os
-import argparse
+import re
 import sys
-from dotenv import load_dotenv
 import logging
 from typing import Optional, Literal, Union
 
 from trader import BasicBot, OrderSide, OrderType
 from logging_config import setup_logging
 
-load_dotenv()
 LOG_FILE = setup_logging()
 logger = logging.getLogger(__name__)
 
+ENV_FILENAME = '.env'
+
+USAGE = (
+    "usage: bot.py [-h] [--price PRICE] [--stop-price STOP_PRICE] "
+    "symbol {BUY,SELL} {MARKET,LIMIT,STOP_LIMIT} quantity"
+)
+
+HELP = f"""{USAGE}
+
+A Simplified Trading Bot for Binance Futures Testnet.
+
+positional arguments:
+  symbol                Trading pair (e.g., BTCUSDT)
+  {{BUY,SELL}}            Order side (BUY or SELL)
+  {{MARKET,LIMIT,STOP_LIMIT}}
+                        Order type (MARKET, LIMIT, or STOP_LIMIT - bonus)
+  quantity              Quantity to trade (e.g., 0.001)
+
+options:
+  -h, --help            show this help message and exit
+  --price PRICE         Limit price (required for LIMIT and STOP_LIMIT orders)
+  --stop-price STOP_PRICE
+                        Stop price (required for STOP_LIMIT orders - bonus)
+
+*** Log files for submission are saved to '{LOG_FILE}'. ***"""
+
+_OPTIONS = {'--price': 'price', '--stop-price': 'stop_price'}
+
+_SIDES = frozenset({'BUY', 'SELL'})
+_ORDER_TYPES = frozenset({'MARKET', 'LIMIT', 'STOP_LIMIT'})
+_PRICE_REQUIRED = frozenset({'LIMIT', 'STOP_LIMIT'})
+_STOP_REQUIRED = frozenset({'STOP_LIMIT'})
+_NEW_STATUSES = frozenset({'NEW', 'PENDING_NEW'})
+_FILLED_STATUSES = frozenset({'FILLED', 'PARTIALLY_FILLED'})
+
+
+def _usage_error(message: str):
+    """Prints usage plus an error and exits, matching argparse's behaviour."""
+    print(f"{USAGE}\nbot.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def _parse_args(argv: list[str]) -> dict[str, Optional[str]]:
+    """Parses the CLI arguments: 4 positionals plus --price/--stop-price.
+
+    Values are checked later by validate_input.
+    """
+    positional: list[str] = []
+    args: dict[str, Optional[str]] = {'price': None, 'stop_price': None}
+
+    it = iter(argv)
+    for arg in it:
+        if arg in ('-h', '--help'):
+            print(HELP)
+            sys.exit(0)
+        if arg.startswith('--'):
+            flag, eq, value = arg.partition('=')
+            if flag not in _OPTIONS:
+                _usage_error(f"unrecognized arguments: {arg}")
+            if not eq:
+                value = next(it, None)
+                if value is None:
+                    _usage_error(f"argument {flag}: expected one argument")
+            args[_OPTIONS[flag]] = value
+        else:
+            positional.append(arg)
+
+    if len(positional) < 4:
+        names = ['symbol', 'side', 'order_type', 'quantity'][len(positional):]
+        _usage_error(f"the following arguments are required: {', '.join(names)}")
+    if len(positional) > 4:
+        _usage_error(f"unrecognized arguments: {' '.join(positional[4:])}")
+
+    symbol, side, order_type, quantity = positional
+    args.update(symbol=symbol, side=side, order_type=order_type, quantity=quantity)
+    return args
+
+def _find_env_file() -> Optional[str]:
+    """Looks for .env next to bot.py, then in each parent directory (as load_dotenv did)."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        path = os.path.join(directory, ENV_FILENAME)
+        if os.path.isfile(path):
+            return path
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def _read_env_file(path: Optional[str]) -> dict[str, str]:
+    """Reads KEY=VALUE pairs from a .env file; a missing file yields an empty dict."""
+    env: dict[str, str] = {}
+    if path is None:
+        return env
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue
+                key, value = line.split('=', 1)
+                key = key.strip()
+                if key.startswith('export '):
+                    key = key[len('export '):].strip()
+                value = value.strip()
+                if value[:1] in ('"', "'"):
+                    end = value.find(value[0], 1)
+                    if end != -1:
+                        value = value[1:end]
+                else:
+                    # Unquoted values end at an inline comment: KEY=abc  # note
+                    comment = re.search(r'\s#', value)
+                    if comment:
+                        value = value[:comment.start()].rstrip()
+                env[key] = value
+    except FileNotFoundError:
+        pass
+    return env
+
+
+def _pos_float(name: str, value: str) -> Optional[float]:
+    """Parses a positive number, logging an error and returning None if invalid."""
+    try:
+        x = float(value)
+        if x <= 0:
+            raise ValueError()
+    except ValueError:
+        logger.error(f"Invalid {name}: {value}. Must be a positive number.")
+        return None
+    return x
+
+
 def validate_input(
     symbol: str, 
     side: str, 
@@ -22,46 +153,41 @@ def validate_input(
 ) -> Optional[tuple[str, OrderSide, OrderType, float, Optional[float], Optional[float]]]:
     
     side_upper = side.upper()
+    if side_upper not in _SIDES:
+        logger.error(f"Invalid side: {side}. Must be BUY or SELL.")
+        return None
+
     order_type_upper = order_type.upper()
+    if order_type_upper not in _ORDER_TYPES:
+        logger.error(f"Invalid order type: {order_type}. Must be MARKET, LIMIT or STOP_LIMIT.")
+        return None
 
-    try:
-        q = float(quantity)
-        if q <= 0:
-            raise ValueError()
-    except ValueError:
-        logger.error(f"Invalid quantity: {quantity}. Must be a positive number.")
+    q = _pos_float('quantity', quantity)
+    if q is None:
         return None
 
     p: Optional[float] = None
-    if order_type_upper in ['LIMIT', 'STOP_LIMIT']:
+    if order_type_upper in _PRICE_REQUIRED:
         if price is None:
             logger.error(f"{order_type_upper} order requires a --price.")
             return None
-        try:
-            p = float(price)
-            if p <= 0:
-                raise ValueError()
-        except ValueError:
-            logger.error(f"Invalid price: {price}. Must be a positive number.")
+        p = _pos_float('price', price)
+        if p is None:
             return None
 
     sp: Optional[float] = None
-    if order_type_upper == 'STOP_LIMIT':
+    if order_type_upper in _STOP_REQUIRED:
         if stop_price is None:
-            logger.error("STOP_LIMIT order requires a --stop-price.")
+            logger.error(f"{order_type_upper} order requires a --stop-price.")
             return None
-        try:
-            sp = float(stop_price)
-            if sp <= 0:
-                raise ValueError()
-            if p is not None and (sp > p and side_upper == 'SELL'):
-                logger.warning("Stop Price > Limit Price for a SELL order (may trigger immediately).")
-            elif p is not None and (sp < p and side_upper == 'BUY'):
-                logger.warning("Stop Price < Limit Price for a BUY order (may trigger immediately).")
-        except ValueError:
-            logger.error(f"Invalid stop-price: {stop_price}. Must be a positive number.")
+        sp = _pos_float('stop-price', stop_price)
+        if sp is None:
             return None
-            
+        if p is not None and (sp > p and side_upper == 'SELL'):
+            logger.warning("Stop Price > Limit Price for a SELL order (may trigger immediately).")
+        elif p is not None and (sp < p and side_upper == 'BUY'):
+            logger.warning("Stop Price < Limit Price for a BUY order (may trigger immediately).")
+
     return (
         symbol.upper().replace("/", ""), 
         side_upper, 
@@ -73,73 +199,36 @@ def validate_input(
 
 
 def main():
-    api_key = os.getenv('BINANCE_API_KEY')
-    api_secret = os.getenv('BINANCE_API_SECRET')
-
-    if not api_key or not api_secret:
-        logger.critical("API Key or Secret not found in .env file. Exiting.")
-        sys.exit("ERROR: Please set BINANCE_API_KEY and BINANCE_API_SECRET in your .env file.")
-    
-    try:
-        bot = BasicBot(api_key=api_key, api_secret=api_secret, testnet=True)
-    except Exception:
-        logger.critical("Bot initialization failed. Exiting.")
-        sys.exit(1)
-
-    parser = argparse.ArgumentParser(
-        description="A Simplified Trading Bot for Binance Futures Testnet.",
-        epilog=f"\n*** Log files for submission are saved to '{LOG_FILE}'. ***"
-    )
-    
-    parser.add_argument(
-        'symbol', 
-        type=str, 
-        help="Trading pair (e.g., BTCUSDT)"
-    )
-    parser.add_argument(
-        'side', 
-        type=str, 
-        choices=['BUY', 'SELL'], 
-        help="Order side (BUY or SELL)"
-    )
-    parser.add_argument(
-        'order_type', 
-        type=str, 
-        choices=['MARKET', 'LIMIT', 'STOP_LIMIT'], 
-        help="Order type (MARKET, LIMIT, or STOP_LIMIT - bonus)"
-    )
-    parser.add_argument(
-        'quantity', 
-        type=str, 
-        help="Quantity to trade (e.g., 0.001)"
-    )
-    parser.add_argument(
-        '--price', 
-        type=str, 
-        default=None, 
-        help="Limit price (required for LIMIT and STOP_LIMIT orders)"
-    )
-    parser.add_argument(
-        '--stop-price', 
-        type=str, 
-        default=None, 
-        help="Stop price (required for STOP_LIMIT orders - bonus)"
-    )
-
     if len(sys.argv) == 1:
-        parser.print_help(sys.stderr)
+        print(HELP, file=sys.stderr)
         sys.exit(1)
 
-    args = parser.parse_args()
+    args = _parse_args(sys.argv[1:])
 
     validated = validate_input(
-        args.symbol, args.side, args.order_type, args.quantity, args.price, args.stop_price
+        args['symbol'], args['side'], args['order_type'], args['quantity'],
+        args['price'], args['stop_price']
     )
 
     if validated is None:
         logger.error("Order processing halted due to invalid input.")
         sys.exit(1)
 
+    # Real environment variables take precedence over the .env file
+    env = _read_env_file(_find_env_file())
+    api_key = os.environ.get('BINANCE_API_KEY') or env.get('BINANCE_API_KEY')
+    api_secret = os.environ.get('BINANCE_API_SECRET') or env.get('BINANCE_API_SECRET')
+
+    if not api_key or not api_secret:
+        logger.critical("API Key or Secret not found in .env file. Exiting.")
+        sys.exit("ERROR: Please set BINANCE_API_KEY and BINANCE_API_SECRET in your .env file.")
+    
+    try:
+        bot = BasicBot(api_key=api_key, api_secret=api_secret, testnet=True)
+    except Exception:
+        logger.critical("Bot initialization failed. Exiting.")
+        sys.exit(1)
+
     symbol, side, order_type, quantity, price, stop_price = validated
     
     print(f"\n--- Attempting to place a {order_type} {side} order for {quantity} {symbol} ---")
@@ -157,25 +246,32 @@ def main():
             symbol, side, quantity, price=price, stop_price=stop_price
         )
 
-    print("\n--- Execution Status ---")
+    lines = ["", "--- Execution Status ---"]
     if order_result:
         status = order_result.get('status', 'N/A')
-        print(f"STATUS: {status}")
-        print(f"SYMBOL: {order_result.get('symbol', 'N/A')}")
-        print(f"ORDER ID: {order_result.get('orderId', 'N/A')}")
+        sym = order_result.get('symbol', 'N/A')
+        oid = order_result.get('orderId', 'N/A')
+        lines += [
+            f"STATUS: {status}",
+            f"SYMBOL: {sym}",
+            f"ORDER ID: {oid}",
+        ]
         
-        if status in ['NEW', 'PENDING_NEW']:
-            print(f"TYPE: {order_result.get('type', 'N/A')}")
-            print(f"PRICE: {order_result.get('price', 'N/A')}")
-        elif status in ['FILLED', 'PARTIALLY_FILLED']:
-            print(f"AVG FILL PRICE: {order_result.get('avgPrice', 'N/A')}")
+        if status in _NEW_STATUSES:
+            typ, prc = order_result.get('type', 'N/A'), order_result.get('price', 'N/A')
+            lines += [f"TYPE: {typ}", f"PRICE: {prc}"]
+        elif status in _FILLED_STATUSES:
+            avg = order_result.get('avgPrice', 'N/A')
+            lines.append(f"AVG FILL PRICE: {avg}")
         
         logger.info(f"Final Order Status Output: {order_result}")
     else:
-        print("STATUS: FAILED (Check log file for detailed error message)")
+        lines.append("STATUS: FAILED (Check log file for detailed error message)")
     
-    print("-" * 30)
-    print(f"Details saved in the log file: {LOG_FILE}")
+    lines += ["-" * 30, f"Details saved in the log file: {LOG_FILE}"]
+
+    # One write for the whole block instead of a print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == '__main__':
@@ -1,38 +1,123 @@
+import atexit
 import logging
 import os
+import queue
+import threading
 import logging.handlers # <-- FIX: Import the handlers submodule
 
 LOG_FILE = 'trading_bot_log.log'
 
-def setup_logging():
+# Headroom below maxBytes inside which a record cannot trigger a rollover.
+ROLLOVER_MARGIN = 64 * 1024 # 64 KB
+
+# Write buffer for the log file; flushed on WARNING+ records and on a timer.
+FILE_BUFFER_SIZE = 64 * 1024 # 64 KB
+FLUSH_INTERVAL = 30 # seconds
+
+# Background listener that owns the file handler.
+_listener = None
+
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that skips the rollover check while far from maxBytes."""
+
+    def shouldRollover(self, record):
+        # The stock check formats the record and stats the file on every emit;
+        # only pay for that once the file gets close to the size limit.
+        # Ask the binary buffer for the position: TextIOWrapper.tell() flushes.
+        if self.stream is not None and self.stream.buffer.tell() + ROLLOVER_MARGIN < self.maxBytes:
+            return False
+        return super().shouldRollover(record)
+
+    def _open(self):
+        # Large write buffer so routine records don't each cost a write() call.
+        return open(
+            self.baseFilename, self.mode,
+            buffering=FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+
+    def emit(self, record):
+        """Writes the record, flushing to disk only for WARNING and above."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _schedule_flush(handler, interval):
+    """Flushes the handler every `interval` seconds on a daemon timer."""
+    def _tick():
+        handler.flush()
+        _schedule_flush(handler, interval)
+
+    timer = threading.Timer(interval, _tick)
+    timer.daemon = True
+    timer.start()
+
+
+def setup_logging(console_level=logging.INFO, file_level=logging.DEBUG):
     """Configures centralized logging for the application."""
+    global _listener
+
     log_format = (
         '%(asctime)s | %(levelname)-8s | '
         '%(module)s:%(funcName)s:%(lineno)d | %(message)s'
     )
+    # One Formatter instance shared by both handlers
+    formatter = logging.Formatter(log_format)
 
     # 1. Console Handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(logging.Formatter(log_format))
+    console_handler.setLevel(console_level)
+    console_handler.setFormatter(formatter)
 
     # 2. File Handler (for the required log files)
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = FastRotatingFileHandler(
         LOG_FILE,
         maxBytes=1024 * 1024 * 5, # 5 MB
         backupCount=5
     )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter(log_format))
+    file_handler.setLevel(file_level)
+    file_handler.setFormatter(formatter)
 
     # 3. Root Logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG) # Lowest level for file logging
+    # No lower than the most verbose handler, so records nobody wants are
+    # dropped by Logger.isEnabledFor before a LogRecord is even built.
+    root_logger.setLevel(min(console_level, file_level))
 
     # Prevent adding duplicate handlers if setup_logging is called multiple times
     if not root_logger.handlers:
+        # Console output stays synchronous so it interleaves correctly with print().
         root_logger.addHandler(console_handler)
-        root_logger.addHandler(file_handler)
+
+        # 4. Queue for the file handler: QueueHandler.prepare still merges the
+        # message and args (and renders any traceback) on the calling thread;
+        # the file handler's formatting and writes run on the listener thread.
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(file_level)
+        root_logger.addHandler(queue_handler)
+        _listener = logging.handlers.QueueListener(
+            log_queue,
+            file_handler,
+            respect_handler_level=True
+        )
+        _listener.start()
+        _schedule_flush(file_handler, FLUSH_INTERVAL)
+        # atexit runs in reverse order: drain the queue first, then flush.
+        atexit.register(file_handler.flush)
+        atexit.register(_listener.stop)
 
     logging.info("Logging configured successfully.")
 
@@ -1,8 +1,14 @@
+import json
 import logging
+import os
+import time
+from pathlib import Path
 from typing import Literal, Optional, Any
 
-from binance.client import Client 
-from binance.exceptions import BinanceAPIException, BinanceRequestException
+try:
+    import orjson
+except ImportError: # optional: fall back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -14,19 +20,68 @@ TimeInForce = Literal['GTC', 'IOC', 'FOK']
 
 TESTNET_URL = 'https://testnet.binancefuture.com'
 
+PRICE_CACHE_TTL = 0.25 # seconds
+PRICE_CACHE_SIZE = 256
+
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 8
+
+EXCHANGE_INFO_CACHE = Path('~/.cache/crypto-bot/exchange_info.json').expanduser()
+EXCHANGE_INFO_TTL = 3600 # seconds
+
+def _is_exchange_info(info: Any) -> bool:
+    """Checks the parts of an exchange info payload that BasicBot relies on."""
+    return (
+        isinstance(info, dict)
+        and isinstance(info.get('symbols'), list)
+        and all(isinstance(s, dict) and 'symbol' in s and 'filters' in s for s in info['symbols'])
+    )
+
+
+class _Json:
+    """Defers JSON-encoding a log argument until the record is actually formatted."""
+    __slots__ = ('obj', '_text')
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        # Each handler's formatter calls getMessage(), so encode only the first time.
+        if self._text is None:
+            if orjson is not None:
+                self._text = orjson.dumps(self.obj, default=str).decode()
+            else:
+                self._text = json.dumps(self.obj, default=str)
+        return self._text
+
+
 class BasicBot:
     """
     Simplified Trading Bot for Binance Futures Testnet (USDT-M).
     Uses the standard Client but targets the Futures Testnet URL.
     """
+    __slots__ = (
+        'client', 'testnet',
+        '_exchange_info', '_valid_symbols', '_symbol_filters', '_price_cache',
+        'async_client', '_async_loop', '_async_lock'
+    )
+
     def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
         """Initializes the Binance Client for Futures."""
         
-        logger.info(f"Initializing BasicBot. Testnet mode: {testnet}")
+        logger.info("Initializing BasicBot. Testnet mode: %s", testnet)
         self.testnet = testnet
+        self._price_cache: dict[str, tuple[float, float]] = {} # symbol -> (timestamp, price)
+        self.async_client = None # created on first place_order_async call
+        self._async_loop = None # event loop that owns async_client
+        self._async_lock = None
         
         try:
-           
+            # Imported here so a CLI run rejected by input validation never loads the SDK.
+            from binance.client import Client
+            from requests.adapters import HTTPAdapter
+
             # This is the most robust way to target Futures without the specific module import
             self.client = Client(
                 api_key, 
@@ -35,31 +90,173 @@ class BasicBot:
               
                 base_url=TESTNET_URL
             )
+
+            # Keep one pooled keep-alive session so later orders reuse the TLS connection.
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=0
+            )
+            self.client.session.mount('https://', adapter)
+            self.client.session.headers['Connection'] = 'keep-alive'
             
-            
-            self.client.futures_exchange_info()
-            logger.info(f"Binance Client initialized and connected to Testnet URL: {TESTNET_URL}")
+            # Keep the symbol metadata for client-side validation.
+            self._exchange_info, from_cache = self._load_exchange_info()
+            symbols = self._exchange_info['symbols']
+            self._valid_symbols = frozenset(s['symbol'] for s in symbols)
+            self._symbol_filters = {s['symbol']: s['filters'] for s in symbols}
+            if from_cache:
+                logger.info("Binance Client initialized for Testnet URL: %s (exchange info from cache)", TESTNET_URL)
+            else:
+                logger.info("Binance Client initialized and connected to Testnet URL: %s", TESTNET_URL)
         except Exception as e:
             
             
-            logger.error(f"Failed to initialize Binance Client. Check API keys and network: {e}")
+            logger.error("Failed to initialize Binance Client. Check API keys and network: %s", e)
             raise 
 
+    def _load_exchange_info(self) -> tuple[dict, bool]:
+        """
+        Returns (exchange info, from_cache): the on-disk cache when it is younger than
+        EXCHANGE_INFO_TTL, otherwise the API (which also checks connectivity).
+        """
+        try:
+            if time.time() - EXCHANGE_INFO_CACHE.stat().st_mtime < EXCHANGE_INFO_TTL:
+                data = EXCHANGE_INFO_CACHE.read_bytes()
+                info = orjson.loads(data) if orjson is not None else json.loads(data)
+                if _is_exchange_info(info):
+                    logger.debug("Loaded exchange info from cache: %s", EXCHANGE_INFO_CACHE)
+                    return info, True
+                logger.warning("Ignoring malformed exchange info cache %s", EXCHANGE_INFO_CACHE)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable exchange info cache %s: %s", EXCHANGE_INFO_CACHE, e)
+
+        info = self.client.futures_exchange_info()
+
+        # Write to a temp file and rename so a crash never leaves a truncated cache.
+        try:
+            EXCHANGE_INFO_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = EXCHANGE_INFO_CACHE.with_suffix('.tmp')
+            with open(tmp, 'wb') as f:
+                f.write(orjson.dumps(info) if orjson is not None else json.dumps(info).encode())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, EXCHANGE_INFO_CACHE)
+        except OSError as e:
+            logger.warning("Could not write exchange info cache %s: %s", EXCHANGE_INFO_CACHE, e)
+
+        return info, False
+
     def get_market_price(self, symbol: str) -> Optional[float]:
         """Fetches the current market price for a symbol using futures method."""
+        from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+        now = time.monotonic()
+        hit = self._price_cache.get(symbol)
+        if hit and now - hit[0] < PRICE_CACHE_TTL:
+            return hit[1]
+
         try:
             
             ticker = self.client.futures_symbol_ticker(symbol=symbol)
             price = float(ticker['price'])
-            logger.info(f"Market price for {symbol}: {price}")
+            logger.info("Market price for %s: %s", symbol, price)
+
+            # FIFO eviction: dicts keep insertion order, so the first key is the oldest.
+            self._price_cache.pop(symbol, None)
+            if len(self._price_cache) >= PRICE_CACHE_SIZE:
+                del self._price_cache[next(iter(self._price_cache))]
+            self._price_cache[symbol] = (now, price)
             return price
         except (BinanceAPIException, BinanceRequestException) as e:
-            logger.error(f"Error fetching market price for {symbol}: {e}")
+            logger.error("Error fetching market price for %s: %s", symbol, e)
             return None
         except Exception as e:
-            logger.error(f"An unexpected error occurred: {e}")
+            logger.error("An unexpected error occurred: %s", e)
+            return None
+
+
+    @staticmethod
+    def _build_params(
+        symbol: str,
+        side: OrderSide,
+        order_type: OrderType,
+        quantity: float,
+        price: Optional[float],
+        time_in_force: Optional[TimeInForce],
+        stop_price: Optional[float]
+    ) -> dict[str, Any]:
+        """Builds the futures_create_order request parameters."""
+        # Build each shape in one literal rather than growing a base dict.
+        if order_type == 'LIMIT' and price is not None:
+            return {
+                'symbol': symbol,
+                'side': side,
+                'type': order_type,
+                'quantity': quantity,
+                'price': price,
+                'timeInForce': time_in_force,
+            }
+        if order_type == 'STOP_LIMIT' and price and stop_price:
+            return {
+                'symbol': symbol,
+                'side': side,
+                'type': order_type,
+                'quantity': quantity,
+                'price': price,
+                'stopPrice': stop_price,
+                'timeInForce': time_in_force,
+            }
+        return {
+            'symbol': symbol,
+            'side': side,
+            'type': order_type,
+            'quantity': quantity,
+        }
+
+    def _prepare_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        order_type: OrderType,
+        quantity: float,
+        price: Optional[float] = None,
+        time_in_force: Optional[TimeInForce] = 'GTC',
+        stop_price: Optional[float] = None
+    ) -> Optional[dict[str, Any]]:
+        """Checks the symbol and builds the request parameters; None if the order is rejected."""
+        if symbol not in self._valid_symbols:
+            logger.error("Invalid symbol: %s. Not listed on Binance Futures.", symbol)
+            print(f"FAILED (Invalid Symbol): {symbol}")
             return None
 
+        params = self._build_params(symbol, side, order_type, quantity, price, time_in_force, stop_price)
+        logger.info("Attempting to place %s order. Request parameters: %s", order_type, _Json(params))
+        return params
+
+    @staticmethod
+    def _order_placed(response: dict) -> dict:
+        """Logs a successful order response and returns it."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Order placed successfully. Response: %s", _Json(response))
+        return response
+
+    @staticmethod
+    def _order_failed(e: Exception, params: dict[str, Any]) -> None:
+        """Logs and prints an order failure; always returns None."""
+        from binance.exceptions import BinanceAPIException
+
+        if isinstance(e, BinanceAPIException):
+            logger.error(
+                "Binance API Error placing order (Code %s): %s. Request: %s", e.code, e.message, _Json(params)
+            )
+            print(f"FAILED (API Error): Code {e.code} | {e.message}")
+        else:
+            logger.error("An unexpected error occurred while placing order: %s. Request: %s", e, _Json(params))
+            print(f"FAILED (Unknown Error): {e}")
+        return None
 
     def place_order(
         self, 
@@ -74,41 +271,119 @@ class BasicBot:
         """
         Places a new order on Binance Futures Testnet using the futures-specific method.
         """
-        
-        params: dict[str, Any] = {
-            'symbol': symbol,
-            'side': side,
-            'type': order_type,
-            'quantity': quantity,
-        }
+        params = self._prepare_order(symbol, side, order_type, quantity, price, time_in_force, stop_price)
+        if params is None:
+            return None
 
-        if order_type == 'LIMIT' and price is not None:
-            params['price'] = price 
-            params['timeInForce'] = time_in_force
-        
-        if order_type == 'STOP_LIMIT' and price and stop_price:
-            params['price'] = price
-            params['stopPrice'] = stop_price
-            params['timeInForce'] = time_in_force
+        try:
+            response = self.client.futures_create_order(**params)
+        except Exception as e:
+            return self._order_failed(e, params)
+        return self._order_placed(response)
+
+    async def _create_async_client(self):
+        """Creates a new AsyncClient, reusing the sync client's credentials."""
+        from binance import AsyncClient
+
+        # Always testnet, matching the sync client's hard-wired TESTNET_URL.
+        return await AsyncClient.create(
+            self.client.API_KEY,
+            self.client.API_SECRET,
+            testnet=True
+        )
+
+    async def _get_async_client(self):
+        """
+        Returns the shared AsyncClient for the running event loop, creating it on first use.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            # The old client's HTTP session is bound to a previous (usually closed)
+            # loop and can't be used or closed from this one; start afresh.
+            self.async_client = None
+            self._async_loop = loop
+            self._async_lock = asyncio.Lock()
 
-        logger.info(f"Attempting to place {order_type} order. Request parameters: {params}")
+        # Concurrent first calls must not each open their own client.
+        async with self._async_lock:
+            if self.async_client is None:
+                self.async_client = await self._create_async_client()
+        return self.async_client
 
+    async def _submit_async(self, client, params: dict[str, Any]) -> Optional[dict]:
+        """Sends prepared order params through an AsyncClient."""
         try:
-            
-            response = self.client.futures_create_order(**params)
-            
-            logger.info(f"Order placed successfully. Response: {response}")
-            return response
+            response = await client.futures_create_order(**params)
+        except Exception as e:
+            return self._order_failed(e, params)
+        return self._order_placed(response)
 
-        except BinanceAPIException as e:
-            logger.error(f"Binance API Error placing order (Code {e.code}): {e.message}. Request: {params}")
-            print(f"FAILED (API Error): Code {e.code} | {e.message}")
+    async def place_order_async(
+        self, 
+        symbol: str, 
+        side: OrderSide, 
+        order_type: OrderType, 
+        quantity: float, 
+        price: Optional[float] = None, 
+        time_in_force: Optional[TimeInForce] = 'GTC',
+        stop_price: Optional[float] = None
+    ) -> Optional[dict]:
+        """
+        Async counterpart of place_order, so several orders can be in flight at once.
+        Uses a shared client for the running loop; call close_async() when done.
+        """
+        params = self._prepare_order(symbol, side, order_type, quantity, price, time_in_force, stop_price)
+        if params is None:
             return None
-            
+
+        try:
+            client = await self._get_async_client()
         except Exception as e:
-            logger.error(f"An unexpected error occurred while placing order: {e}. Request: {params}")
+            return self._order_failed(e, params)
+        return await self._submit_async(client, params)
+
+    async def place_orders(self, specs: list[dict[str, Any]]) -> list[Optional[dict]]:
+        """
+        Places several orders concurrently. Each spec holds place_order keyword arguments;
+        results come back in the same order, with None for any order that failed.
+        The batch opens its own client and closes it before returning.
+        """
+        # Imported here so the sync CLI path doesn't pay asyncio's import cost.
+        import asyncio
+
+        results: list[Optional[dict]] = [None] * len(specs)
+        prepared = [(i, self._prepare_order(**spec)) for i, spec in enumerate(specs)]
+        prepared = [(i, params) for i, params in prepared if params is not None]
+        if not prepared:
+            return results
+
+        try:
+            client = await self._create_async_client()
+        except Exception as e:
+            logger.error("Failed to initialize async Binance Client. No orders placed: %s", e)
             print(f"FAILED (Unknown Error): {e}")
-            return None
+            return results
+
+        try:
+            responses = await asyncio.gather(*(self._submit_async(client, params) for _, params in prepared))
+        finally:
+            await client.close_connection()
+
+        for (i, _), response in zip(prepared, responses):
+            results[i] = response
+        return results
+
+    async def close_async(self):
+        """Closes the shared AsyncClient's HTTP session, if one was opened."""
+        import asyncio
+
+        if self.async_client is not None and self._async_loop is asyncio.get_running_loop():
+            await self.async_client.close_connection()
+        self.async_client = None
+        self._async_loop = None
+        self._async_lock = None
 
     
 